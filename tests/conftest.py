@@ -1,85 +1,64 @@
 """Pytest configuration and fixtures for testing the High School Management System API."""
 
+import orjson
 import pytest
-from fastapi.testclient import TestClient
-import sys
-from pathlib import Path
-
-# Add src directory to Python path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
 
 from app import app, activities
 
 
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "no_reset: skip the activities reset; only for tests that never change "
+        "participants, since a leaked change would persist into later tests",
+    )
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def client():
+    """Create a single async test client for the FastAPI application, shared by all tests."""
+    # ASGITransport does not run lifespan events; the app defines none
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as test_client:
+        yield test_client
+
+
 @pytest.fixture
-def client():
-    """Create a test client for the FastAPI application."""
-    return TestClient(app)
+def get_activities(client):
+    """Return a coroutine function that fetches GET /activities, caching the decoded body.
+
+    Call it with ``refresh=True`` after a mutation to fetch fresh data.
+    """
+    cache = {}
+
+    async def _get_activities(refresh=False):
+        if refresh or "activities" not in cache:
+            response = await client.get("/activities")
+            cache["activities"] = orjson.loads(response.content)
+        return cache["activities"]
+
+    return _get_activities
 
 
 @pytest.fixture(autouse=True)
-def reset_activities():
-    """Reset activities data before each test to ensure test isolation."""
-    # Save original state
-    original_activities = {
-        "Soccer Team": {
-            "description": "Join the varsity soccer team and compete in regional tournaments",
-            "schedule": "Mondays, Wednesdays, Fridays, 3:30 PM - 5:30 PM",
-            "max_participants": 25,
-            "participants": ["alex@mergington.edu", "sarah@mergington.edu"]
-        },
-        "Basketball Club": {
-            "description": "Practice basketball skills and play friendly matches",
-            "schedule": "Tuesdays and Thursdays, 4:00 PM - 6:00 PM",
-            "max_participants": 15,
-            "participants": ["james@mergington.edu", "emily@mergington.edu"]
-        },
-        "Art Studio": {
-            "description": "Explore various art mediums including painting, drawing, and sculpture",
-            "schedule": "Wednesdays, 3:30 PM - 5:00 PM",
-            "max_participants": 18,
-            "participants": ["lily@mergington.edu", "noah@mergington.edu"]
-        },
-        "Drama Club": {
-            "description": "Perform in plays and musicals throughout the school year",
-            "schedule": "Mondays and Thursdays, 3:30 PM - 5:30 PM",
-            "max_participants": 30,
-            "participants": ["ava@mergington.edu", "ethan@mergington.edu"]
-        },
-        "Debate Team": {
-            "description": "Develop critical thinking and public speaking through competitive debates",
-            "schedule": "Tuesdays, 3:30 PM - 5:00 PM",
-            "max_participants": 16,
-            "participants": ["mia@mergington.edu", "william@mergington.edu"]
-        },
-        "Science Olympiad": {
-            "description": "Compete in science and engineering events at state and national levels",
-            "schedule": "Thursdays, 3:30 PM - 5:00 PM",
-            "max_participants": 20,
-            "participants": ["charlotte@mergington.edu", "benjamin@mergington.edu"]
-        },
-        "Chess Club": {
-            "description": "Learn strategies and compete in chess tournaments",
-            "schedule": "Fridays, 3:30 PM - 5:00 PM",
-            "max_participants": 12,
-            "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
-        },
-        "Programming Class": {
-            "description": "Learn programming fundamentals and build software projects",
-            "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
-            "max_participants": 20,
-            "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
-        },
-        "Gym Class": {
-            "description": "Physical education and sports activities",
-            "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
-            "max_participants": 30,
-            "participants": ["john@mergington.edu", "olivia@mergington.edu"]
-        }
-    }
-    
+def reset_activities(request):
+    """Reset activities data after each test to ensure test isolation."""
+    if request.node.get_closest_marker("no_reset"):
+        yield
+        return
+
+    # Only the participants lists are mutated by the API, so save just those,
+    # paired with the live list objects so restoring needs no dict lookups
+    saved_participants = [
+        (details["participants"], details["participants"][:])
+        for details in activities.values()
+    ]
+
     yield
-    
-    # Reset to original state after test
-    activities.clear()
-    activities.update(original_activities)
+
+    # Restore in place: the app and the tests keep referencing the same
+    # activities dict, so it must never be rebound
+    for participants, original in saved_participants:
+        participants[:] = original
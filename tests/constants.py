@@ -0,0 +1,28 @@
+"""Shared email and activity name constants for the API tests."""
+
+# Activity names
+SOCCER_TEAM = "Soccer Team"
+BASKETBALL_CLUB = "Basketball Club"
+ART_STUDIO = "Art Studio"
+DRAMA_CLUB = "Drama Club"
+DEBATE_TEAM = "Debate Team"
+CHESS_CLUB = "Chess Club"
+PROGRAMMING_CLASS = "Programming Class"
+NONEXISTENT_ACTIVITY = "Nonexistent Activity"
+
+# Students already signed up in the seed data
+ALEX = "alex@mergington.edu"
+JAMES = "james@mergington.edu"
+
+# Students not in the seed data
+NEW_STUDENT = "newstudent@mergington.edu"
+NEW_CHESS_PLAYER = "newchessplayer@mergington.edu"
+NOT_REGISTERED = "notregistered@mergington.edu"
+STUDENT = "student@mergington.edu"
+WORKFLOW_STUDENT = "workflow@mergington.edu"
+STUDENT_1 = "student1@mergington.edu"
+STUDENT_2 = "student2@mergington.edu"
+STUDENT_3 = "student3@mergington.edu"
+PROGRAMMER_1 = "programmer1@mergington.edu"
+PROGRAMMER_2 = "programmer2@mergington.edu"
+PROGRAMMER_3 = "programmer3@mergington.edu"
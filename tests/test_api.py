@@ -1,14 +1,67 @@
 """Tests for the High School Management System API endpoints."""
 
+import orjson
 import pytest
 
+from app import activities as _state
+from tests.constants import (
+    ALEX,
+    ART_STUDIO,
+    BASKETBALL_CLUB,
+    CHESS_CLUB,
+    DEBATE_TEAM,
+    DRAMA_CLUB,
+    JAMES,
+    NEW_CHESS_PLAYER,
+    NEW_STUDENT,
+    NONEXISTENT_ACTIVITY,
+    NOT_REGISTERED,
+    PROGRAMMER_1,
+    PROGRAMMER_2,
+    PROGRAMMER_3,
+    PROGRAMMING_CLASS,
+    SOCCER_TEAM,
+    STUDENT,
+    STUDENT_1,
+    STUDENT_2,
+    STUDENT_3,
+    WORKFLOW_STUDENT,
+)
+
+
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+
+def _json(response):
+    """Decode a response body with orjson instead of the stdlib json module."""
+    return orjson.loads(response.content)
+
+
+# Precomputed (url, email, activity) tuples shared by the multi-signup tests
+_MULTI_SIGNUP_URLS = [
+    (f"/activities/{activity}/signup?email={email}", email, activity)
+    for email, activity in [
+        (STUDENT_1, ART_STUDIO),
+        (STUDENT_2, DRAMA_CLUB),
+        (STUDENT_3, DEBATE_TEAM),
+    ]
+]
+
+_PROGRAMMING_EMAILS = [PROGRAMMER_1, PROGRAMMER_2, PROGRAMMER_3]
+_PROGRAMMING_SIGNUP_URLS = [
+    f"/activities/{PROGRAMMING_CLASS}/signup?email={email}"
+    for email in _PROGRAMMING_EMAILS
+]
+_PROGRAMMING_UNREGISTER_URL = f"/activities/{PROGRAMMING_CLASS}/unregister?email={PROGRAMMER_1}"
+
 
 class TestRootEndpoint:
     """Tests for the root endpoint."""
     
-    def test_root_redirects_to_static_index(self, client):
+    @pytest.mark.no_reset
+    async def test_root_redirects_to_static_index(self, client):
         """Test that root endpoint redirects to the static index page."""
-        response = client.get("/", follow_redirects=False)
+        response = await client.get("/", follow_redirects=False)
         assert response.status_code == 307
         assert response.headers["location"] == "/static/index.html"
 
@@ -16,231 +69,221 @@ class TestRootEndpoint:
 class TestGetActivities:
     """Tests for the GET /activities endpoint."""
     
-    def test_get_activities_returns_all_activities(self, client):
+    @pytest.mark.no_reset
+    async def test_get_activities_returns_all_activities(self, client):
         """Test that GET /activities returns all activities."""
-        response = client.get("/activities")
+        response = await client.get("/activities")
         assert response.status_code == 200
         
-        activities = response.json()
+        activities = _json(response)
         assert isinstance(activities, dict)
         assert len(activities) == 9
-        assert "Soccer Team" in activities
-        assert "Basketball Club" in activities
-        assert "Programming Class" in activities
+        assert SOCCER_TEAM in activities
+        assert BASKETBALL_CLUB in activities
+        assert PROGRAMMING_CLASS in activities
     
-    def test_get_activities_has_correct_structure(self, client):
+    @pytest.mark.no_reset
+    async def test_get_activities_has_correct_structure(self, get_activities):
         """Test that activities have the correct structure."""
-        response = client.get("/activities")
-        activities = response.json()
+        activities = await get_activities()
         
-        soccer_team = activities["Soccer Team"]
+        soccer_team = activities[SOCCER_TEAM]
         assert "description" in soccer_team
         assert "schedule" in soccer_team
         assert "max_participants" in soccer_team
         assert "participants" in soccer_team
         assert isinstance(soccer_team["participants"], list)
         assert soccer_team["max_participants"] == 25
+    
+    async def test_get_activities_reflects_signup_after_refresh(self, client, get_activities):
+        """Test that GET /activities shows a new signup once re-fetched."""
+        before = await get_activities()
+        assert NEW_STUDENT not in before[SOCCER_TEAM]["participants"]
+        
+        response = await client.post(
+            f"/activities/{SOCCER_TEAM}/signup?email={NEW_STUDENT}"
+        )
+        assert response.status_code == 200
+        
+        # The cached payload is unchanged until refreshed
+        cached = await get_activities()
+        assert cached is before
+        assert NEW_STUDENT not in cached[SOCCER_TEAM]["participants"]
+        
+        refreshed = await get_activities(refresh=True)
+        assert NEW_STUDENT in refreshed[SOCCER_TEAM]["participants"]
 
 
 class TestSignupForActivity:
     """Tests for the POST /activities/{activity_name}/signup endpoint."""
     
-    def test_signup_new_student_success(self, client):
+    async def test_signup_new_student_success(self, client):
         """Test successful signup of a new student."""
-        response = client.post(
-            "/activities/Soccer Team/signup?email=newstudent@mergington.edu"
+        response = await client.post(
+            f"/activities/{SOCCER_TEAM}/signup?email={NEW_STUDENT}"
         )
         assert response.status_code == 200
         
-        data = response.json()
+        data = _json(response)
         assert "message" in data
-        assert "newstudent@mergington.edu" in data["message"]
-        assert "Soccer Team" in data["message"]
+        assert NEW_STUDENT in data["message"]
+        assert SOCCER_TEAM in data["message"]
         
         # Verify student was added
-        activities_response = client.get("/activities")
-        activities = activities_response.json()
-        assert "newstudent@mergington.edu" in activities["Soccer Team"]["participants"]
+        assert NEW_STUDENT in _state[SOCCER_TEAM]["participants"]
     
-    def test_signup_duplicate_student_fails(self, client):
+    async def test_signup_duplicate_student_fails(self, client):
         """Test that signing up the same student twice fails."""
-        email = "alex@mergington.edu"
+        email = ALEX
         
         # Try to signup student who is already registered
-        response = client.post(
-            f"/activities/Soccer Team/signup?email={email}"
+        response = await client.post(
+            f"/activities/{SOCCER_TEAM}/signup?email={email}"
         )
         assert response.status_code == 400
         
-        data = response.json()
+        data = _json(response)
         assert "already signed up" in data["detail"].lower()
     
-    def test_signup_nonexistent_activity_fails(self, client):
-        """Test that signing up for a non-existent activity fails."""
-        response = client.post(
-            "/activities/Nonexistent Activity/signup?email=student@mergington.edu"
-        )
-        assert response.status_code == 404
-        
-        data = response.json()
-        assert "not found" in data["detail"].lower()
-    
-    def test_signup_with_url_encoded_activity_name(self, client):
-        """Test signup with URL-encoded activity name."""
-        response = client.post(
-            "/activities/Chess%20Club/signup?email=newchessplayer@mergington.edu"
-        )
+    @pytest.mark.parametrize(
+        "url,email,activity",
+        _MULTI_SIGNUP_URLS,
+        ids=[email for _, email, _ in _MULTI_SIGNUP_URLS],
+    )
+    async def test_signup_multiple_students_to_different_activities(self, client, url, email, activity):
+        """Test signing up students to different activities."""
+        response = await client.post(url)
         assert response.status_code == 200
         
-        data = response.json()
-        assert "Chess Club" in data["message"]
-    
-    def test_signup_multiple_students_to_different_activities(self, client):
-        """Test signing up multiple students to different activities."""
-        students = [
-            ("student1@mergington.edu", "Art Studio"),
-            ("student2@mergington.edu", "Drama Club"),
-            ("student3@mergington.edu", "Debate Team"),
-        ]
-        
-        for email, activity in students:
-            response = client.post(
-                f"/activities/{activity}/signup?email={email}"
-            )
-            assert response.status_code == 200
-        
-        # Verify all students were added
-        activities_response = client.get("/activities")
-        activities = activities_response.json()
-        
-        for email, activity in students:
-            assert email in activities[activity]["participants"]
+        # Verify student was added
+        assert email in _state[activity]["participants"]
 
 
 class TestUnregisterFromActivity:
     """Tests for the DELETE /activities/{activity_name}/unregister endpoint."""
     
-    def test_unregister_existing_student_success(self, client):
+    async def test_unregister_existing_student_success(self, client):
         """Test successful unregistration of an existing student."""
-        email = "alex@mergington.edu"
+        email = ALEX
         
         # Verify student is registered
-        activities_response = client.get("/activities")
-        activities = activities_response.json()
-        assert email in activities["Soccer Team"]["participants"]
+        assert email in _state[SOCCER_TEAM]["participants"]
         
         # Unregister student
-        response = client.delete(
-            f"/activities/Soccer Team/unregister?email={email}"
+        response = await client.delete(
+            f"/activities/{SOCCER_TEAM}/unregister?email={email}"
         )
         assert response.status_code == 200
         
-        data = response.json()
+        data = _json(response)
         assert "message" in data
         assert email in data["message"]
         assert "Unregistered" in data["message"] or "unregistered" in data["message"].lower()
         
         # Verify student was removed
-        activities_response = client.get("/activities")
-        activities = activities_response.json()
-        assert email not in activities["Soccer Team"]["participants"]
+        assert email not in _state[SOCCER_TEAM]["participants"]
     
-    def test_unregister_non_registered_student_fails(self, client):
+    async def test_unregister_non_registered_student_fails(self, client):
         """Test that unregistering a non-registered student fails."""
-        response = client.delete(
-            "/activities/Soccer Team/unregister?email=notregistered@mergington.edu"
+        response = await client.delete(
+            f"/activities/{SOCCER_TEAM}/unregister?email={NOT_REGISTERED}"
         )
         assert response.status_code == 400
         
-        data = response.json()
+        data = _json(response)
         assert "not signed up" in data["detail"].lower()
+
+
+class TestActivityNameInPath:
+    """Tests for how signup and unregister resolve the activity name in the path."""
     
-    def test_unregister_from_nonexistent_activity_fails(self, client):
-        """Test that unregistering from a non-existent activity fails."""
-        response = client.delete(
-            "/activities/Nonexistent Activity/unregister?email=student@mergington.edu"
+    @pytest.mark.parametrize(
+        "method,activity_path,operation,email,activity,message,expect_present",
+        [
+            ("post", "Chess%20Club", "signup", NEW_CHESS_PLAYER, CHESS_CLUB, "Signed up", True),
+            ("delete", "Basketball%20Club", "unregister", JAMES, BASKETBALL_CLUB, "Unregistered", False),
+        ],
+        ids=["signup", "unregister"],
+    )
+    async def test_url_encoded_activity_name(
+        self, client, method, activity_path, operation, email, activity, message, expect_present
+    ):
+        """Test signup and unregister with a URL-encoded activity name."""
+        response = await getattr(client, method)(
+            f"/activities/{activity_path}/{operation}?email={email}"
         )
-        assert response.status_code == 404
+        assert response.status_code == 200
         
-        data = response.json()
-        assert "not found" in data["detail"].lower()
-    
-    def test_unregister_with_url_encoded_activity_name(self, client):
-        """Test unregister with URL-encoded activity name."""
-        email = "james@mergington.edu"
+        data = _json(response)
+        assert message in data["message"]
+        assert activity in data["message"]
         
-        response = client.delete(
-            f"/activities/Basketball%20Club/unregister?email={email}"
+        # Verify the student was added or removed
+        if expect_present:
+            assert email in _state[activity]["participants"]
+        else:
+            assert email not in _state[activity]["participants"]
+    
+    @pytest.mark.parametrize("method,operation", [
+        ("post", "signup"),
+        ("delete", "unregister"),
+    ])
+    async def test_nonexistent_activity_fails(self, client, method, operation):
+        """Test that signup and unregister for a non-existent activity fail."""
+        response = await getattr(client, method)(
+            f"/activities/{NONEXISTENT_ACTIVITY}/{operation}?email={STUDENT}"
         )
-        assert response.status_code == 200
+        assert response.status_code == 404
         
-        # Verify student was removed
-        activities_response = client.get("/activities")
-        activities = activities_response.json()
-        assert email not in activities["Basketball Club"]["participants"]
+        data = _json(response)
+        assert "not found" in data["detail"].lower()
 
 
 class TestSignupAndUnregisterWorkflow:
     """Integration tests for signup and unregister workflows."""
     
-    def test_signup_then_unregister_workflow(self, client):
+    async def test_signup_then_unregister_workflow(self, client):
         """Test the complete workflow of signing up and then unregistering."""
-        email = "workflow@mergington.edu"
-        activity = "Chess Club"
+        email = WORKFLOW_STUDENT
+        activity = CHESS_CLUB
         
         # 1. Sign up
-        signup_response = client.post(
+        signup_response = await client.post(
             f"/activities/{activity}/signup?email={email}"
         )
         assert signup_response.status_code == 200
         
         # 2. Verify signup
-        activities_response = client.get("/activities")
-        activities = activities_response.json()
-        assert email in activities[activity]["participants"]
+        assert email in _state[activity]["participants"]
         
         # 3. Unregister
-        unregister_response = client.delete(
+        unregister_response = await client.delete(
             f"/activities/{activity}/unregister?email={email}"
         )
         assert unregister_response.status_code == 200
         
         # 4. Verify unregistration
-        activities_response = client.get("/activities")
-        activities = activities_response.json()
-        assert email not in activities[activity]["participants"]
+        assert email not in _state[activity]["participants"]
     
-    def test_multiple_signups_and_unregisters(self, client):
+    async def test_multiple_signups_and_unregisters(self, client):
         """Test multiple signup and unregister operations."""
-        activity = "Programming Class"
-        emails = [
-            "programmer1@mergington.edu",
-            "programmer2@mergington.edu",
-            "programmer3@mergington.edu"
-        ]
+        activity = PROGRAMMING_CLASS
+        emails = _PROGRAMMING_EMAILS
         
         # Sign up all students
-        for email in emails:
-            response = client.post(
-                f"/activities/{activity}/signup?email={email}"
-            )
+        for url in _PROGRAMMING_SIGNUP_URLS:
+            response = await client.post(url)
             assert response.status_code == 200
         
         # Verify all are registered
-        activities_response = client.get("/activities")
-        activities = activities_response.json()
         for email in emails:
-            assert email in activities[activity]["participants"]
+            assert email in _state[activity]["participants"]
         
         # Unregister first student
-        response = client.delete(
-            f"/activities/{activity}/unregister?email={emails[0]}"
-        )
+        response = await client.delete(_PROGRAMMING_UNREGISTER_URL)
         assert response.status_code == 200
         
         # Verify first student removed, others remain
-        activities_response = client.get("/activities")
-        activities = activities_response.json()
-        assert emails[0] not in activities[activity]["participants"]
-        assert emails[1] in activities[activity]["participants"]
-        assert emails[2] in activities[activity]["participants"]
+        participants = set(_state[activity]["participants"])
+        assert PROGRAMMER_1 not in participants
+        assert {PROGRAMMER_2, PROGRAMMER_3} <= participants